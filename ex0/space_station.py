@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import (
+    BaseModel, ConfigDict, Field, TypeAdapter, ValidationError)
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
+from typing import Annotated
 
 """
 Simple example of data validation using Pydantic.
 Defines a SpaceStation model and demonstrates valid and invalid inputs.
 """
 
+_SEP = "=" * 40
+
+# Shared by power_level and oxygen_level
+Percentage = Annotated[float, Field(ge=0.0, le=100.0)]
+
 
 class SpaceStation(BaseModel):
     """
@@ -21,34 +30,55 @@ class SpaceStation(BaseModel):
     * Optional notes or comments
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     station_id: str = Field(..., min_length=3, max_length=10)
     name: str = Field(..., min_length=1, max_length=50)
     crew_size: int = Field(..., ge=1, le=20)
-    power_level: float = Field(..., ge=0.0, le=100.0)
-    oxygen_level: float = Field(..., ge=0.0, le=100.0)
+    power_level: Percentage
+    oxygen_level: Percentage
     last_maintenance: datetime
     is_operational: bool = True
     notes: str | None = Field(None, max_length=200)
 
+    @classmethod
+    def from_json_bytes(cls, raw: bytes) -> "SpaceStation":
+        # Goes through the module's cached adapter, defined below
+        return _STATION_ADAPTER.validate_json(raw)
+
+
+# Built once at import time so the compiled validator is reused on each call
+_STATION_ADAPTER = TypeAdapter(SpaceStation)
+_STATIONS_ADAPTER = TypeAdapter(list[SpaceStation])
+
+
+def validate_stations(records: list[Mapping]) -> list[SpaceStation]:
+    # Validates every record in a single call into pydantic-core
+    return _STATIONS_ADAPTER.validate_python(records)
+
+
+_VALID_STATION_DATA = MappingProxyType({
+    "station_id": "ISS001",
+    "name": "International Space Station",
+    "crew_size": 6,
+    "power_level": 85.5,
+    "oxygen_level": 92.3,
+    # Pydantic will parse this ISO string into a datetime
+    "last_maintenance": "2024-01-20T12:00:00",
+    "is_operational": True
+})
+
+_INVALID_STATION_DATA = MappingProxyType(
+    {**_VALID_STATION_DATA, "crew_size": 25})
+
 
 def main() -> None:
     print("Space Station Data Validation")
-    print("========================================")
+    print(_SEP)
 
     # CASE 1: Valid station data
-    valid_data = {
-        "station_id": "ISS001",
-        "name": "International Space Station",
-        "crew_size": 6,
-        "power_level": 85.5,
-        "oxygen_level": 92.3,
-        # Pydantic will parse this ISO string into a datetime
-        "last_maintenance": "2024-01-20T12:00:00",
-        "is_operational": True
-    }
-
     try:
-        station = SpaceStation(**valid_data)
+        station = _STATION_ADAPTER.validate_python(_VALID_STATION_DATA)
         print("Valid station created:")
         print(f"ID: {station.station_id}")
         print(f"Name: {station.name}")
@@ -59,21 +89,27 @@ def main() -> None:
     except ValidationError as e:
         print(f"Unexpected error: {e}")
     print("")
-    print("========================================")
+    print(_SEP)
     # CASE 2: Invalid station (crew size too large)
     print("Expected validation error:")
-    invalid_data = valid_data.copy()
-    invalid_data["crew_size"] = 25
-
     try:
-        SpaceStation(**invalid_data)
+        _STATION_ADAPTER.validate_python(_INVALID_STATION_DATA)
     except ValidationError as e:
         # Print only the first validation error message
-        print(e.errors()[0]["msg"])
-        """
-        Extracts and prints the human-readable message of the
-        first validation error raised by Pydantic.
-        """
+        errors = e.errors(
+            include_url=False, include_context=False, include_input=False)
+        print(errors[0]["msg"])
+
+    print("")
+    print(_SEP)
+    # CASE 3: Batch with one valid and one invalid record
+    print("Expected batch validation error:")
+    try:
+        validate_stations([_VALID_STATION_DATA, _INVALID_STATION_DATA])
+    except ValidationError as e:
+        errors = e.errors(
+            include_url=False, include_context=False, include_input=False)
+        print(f"{errors[0]['loc']}: {errors[0]['msg']}")
 
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
-from pydantic import BaseModel, Field, model_validator, ValidationError
+from pydantic import (
+    BaseModel, ConfigDict, Field, TypeAdapter, model_validator,
+    ValidationError)
 from enum import Enum
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 
 """
 Alien Contact Log Validation Module
@@ -10,6 +14,9 @@ This module defines models and validation rules for extraterrestrial
 contact reports using Pydantic v2.
 """
 
+_AC_PREFIX = "AC"
+_SEP = "=" * 40
+
 
 class ContactType(str, Enum):
     # Enumeration of authorized alien contact types.
@@ -35,6 +42,8 @@ class AlienContact(BaseModel):
         is_verified: Verification status.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     contact_id: str = Field(..., min_length=5, max_length=15)
     timestamp: datetime
     location: str = Field(..., min_length=3, max_length=100)
@@ -51,19 +60,18 @@ class AlienContact(BaseModel):
         Validates complex business rules after individual field validation.
         Note: In Pydantic v2 mode='after', the first argument is 'self'.
         """
-        # Rule 1: ID Prefix (Fixed typo: .startswith instead of .startwith)
-        if not self.contact_id.startswith("AC"):
+        # Rule 1: ID Prefix
+        if not self.contact_id.startswith(_AC_PREFIX):
             raise ValueError("Contact ID must start with 'AC'")
 
+        ct = self.contact_type
+
         # Rule 2: Physical contact must be verified
-        if self.contact_type == ContactType.PHYSICAL and not self.is_verified:
+        if ct is ContactType.PHYSICAL and not self.is_verified:
             raise ValueError("Physical contact reports must be verified")
 
         # Rule 3: Telepathic contact requirements
-        if (
-            self.contact_type == ContactType.TELEPATHIC
-            and self.witness_count < 3
-        ):
+        if ct is ContactType.TELEPATHIC and self.witness_count < 3:
             raise ValueError(
                 "Telepathic contact requires at least 3 witnesses")
 
@@ -74,6 +82,18 @@ class AlienContact(BaseModel):
 
         return self
 
+    @classmethod
+    def from_json_bytes(cls, raw: bytes) -> "AlienContact":
+        return _CONTACT_ADAPTER.validate_json(raw)
+
+
+_CONTACT_ADAPTER = TypeAdapter(AlienContact)
+_CONTACTS_ADAPTER = TypeAdapter(list[AlienContact])
+
+
+def validate_contacts(records: list[Mapping]) -> list[AlienContact]:
+    return _CONTACTS_ADAPTER.validate_python(records)
+
 
 def print_contact_report(contact: AlienContact) -> None:
     # Displays contact information in a formatted way.
@@ -90,43 +110,59 @@ def print_contact_report(contact: AlienContact) -> None:
     print(f"Message: {msg}")
 
 
+_VALID_CONTACT_DATA = MappingProxyType({
+    "contact_id": "AC_2024_001",
+    "timestamp": "2024-01-20T14:30:00",
+    "location": "Area 51, Nevada",
+    "contact_type": "radio",
+    "signal_strength": 8.5,
+    "duration_minutes": 45,
+    "witness_count": 5,
+    "message_received": "Greetings from Zeta Reticuli",
+    "is_verified": True,
+})
+
+_INVALID_CONTACT_DATA = MappingProxyType({
+    **_VALID_CONTACT_DATA,
+    "contact_id": "AC_2024_002",
+    "contact_type": "telepathic",
+    "witness_count": 1,  # This violates the rule
+})
+
+
 def main() -> None:
     print("Alien Contact Log Validation")
-    print("========================================")
+    print(_SEP)
 
     # CASE 1: Valid contact
-    valid_data = {
-        "contact_id": "AC_2024_001",
-        "timestamp": "2024-01-20T14:30:00",
-        "location": "Area 51, Nevada",
-        "contact_type": "radio",
-        "signal_strength": 8.5,
-        "duration_minutes": 45,
-        "witness_count": 5,
-        "message_received": "Greetings from Zeta Reticuli",
-        "is_verified": True,
-    }
-
     try:
-        contact = AlienContact(**valid_data)
+        contact = _CONTACT_ADAPTER.validate_python(_VALID_CONTACT_DATA)
         print_contact_report(contact)
     except ValidationError as e:
         print(f"Unexpected error: {e}")
 
-    print("\n========================================")
+    print(f"\n{_SEP}")
 
     # CASE 2: Invalid contact (Telepathic with < 3 witnesses)
     print("Expected validation error:")
-    invalid_data = valid_data.copy()
-    invalid_data["contact_id"] = "AC_2024_002"
-    invalid_data["contact_type"] = "telepathic"
-    invalid_data["witness_count"] = 1  # This violates the rule
-
     try:
-        AlienContact(**invalid_data)
+        _CONTACT_ADAPTER.validate_python(_INVALID_CONTACT_DATA)
     except ValidationError as e:
         # Prints the specific business rule error message
-        print(e.errors()[0]["msg"])
+        errors = e.errors(
+            include_url=False, include_context=False, include_input=False)
+        print(errors[0]["msg"])
+
+    print("")
+    print(_SEP)
+    # CASE 3: Batch with one valid and one invalid record
+    print("Expected batch validation error:")
+    try:
+        validate_contacts([_VALID_CONTACT_DATA, _INVALID_CONTACT_DATA])
+    except ValidationError as e:
+        errors = e.errors(
+            include_url=False, include_context=False, include_input=False)
+        print(f"{errors[0]['loc']}: {errors[0]['msg']}")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 
-from pydantic import BaseModel, ValidationError, Field, model_validator
+from pydantic import (
+    BaseModel, ConfigDict, ValidationError, Field, TypeAdapter,
+    model_validator)
 from enum import Enum
+from collections.abc import Mapping
 from datetime import datetime
-from typing import List
+from types import MappingProxyType
 
 """
 Validates space missions and crew requirements using Pydantic nested models.
 """
 
+_M_PREFIX = "M"
+_SEP = "=" * 40
+
 
 class Rank(str, Enum):
     # Defining the allowed ranks as an Enum ensures Pydantic
@@ -20,8 +26,20 @@ class Rank(str, Enum):
     COMMANDER = "commander"
 
 
+# One bit per rank, stored on each member so the crew loop can OR
+# m.rank._bit without hashing the enum
+for _i, _rank in enumerate(Rank):
+    _rank._bit = 1 << _i
+del _i, _rank
+
+# Ranks that count as mission leadership
+_LEADER_MASK = Rank.CAPTAIN._bit | Rank.COMMANDER._bit
+
+
 class CrewMember(BaseModel):
     # Defines the individual data for each crew member
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     member_id: str = Field(..., min_length=3, max_length=10)
     name: str = Field(..., min_length=2, max_length=50)
     rank: Rank
@@ -33,12 +51,14 @@ class CrewMember(BaseModel):
 
 class SpaceMission(BaseModel):
     # Space Model: handles the core mission data and validation logic
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     mission_id: str = Field(..., min_length=5, max_length=15)
     mission_name: str = Field(..., min_length=3, max_length=100)
     destination: str = Field(..., min_length=3, max_length=50)
     launch_date: datetime
     duration_days: int = Field(..., ge=1, le=3650)
-    crew: List[CrewMember] = Field(..., min_length=1, max_length=12)
+    crew: tuple[CrewMember, ...] = Field(..., min_length=1, max_length=12)
     mission_status: str = "planned"
     budget_millions: float = Field(..., ge=1.0, le=10000.0)
 
@@ -46,75 +66,104 @@ class SpaceMission(BaseModel):
     @model_validator(mode='after')
     def validate_mission_safety(self) -> "SpaceMission":
         # Rule 1: Check mission_id
-        if not self.mission_id.startswith("M"):
+        if not self.mission_id.startswith(_M_PREFIX):
             raise ValueError("Mission ID must start with 'M'")
 
-        # Rule 2: Check for leadership (Captain or Commander)
-        # Is ANY member's rank a Caption o r Commander
-        has_leader = any(
-            m.rank in [Rank.CAPTAIN, Rank.COMMANDER] for m in self.crew)
+        # Single pass over the crew collecting what rules 2-4 need
+        rank_bits = 0
+        all_active = True
+        exp = 0
+        for m in self.crew:
+            rank_bits |= m.rank._bit
+            if m.years_experience >= 5:
+                exp += 1
+            if not m.is_active:
+                all_active = False
 
-        if not has_leader:
+        # Rule 2: Check for leadership (Captain or Commander)
+        if not rank_bits & _LEADER_MASK:
             raise ValueError(
                 "Mission must have at least one Commander or Captain")
 
-        # Rule 3: Check long-duration experience
-        if self.duration_days > 365:
-            # Create a list of only the experienced members
-            exeprienced_members = [
-                m for m in self.crew if m.years_experience >= 5]
-
-            # Move the check INSIDE the if-block
-            if len(exeprienced_members) < (len(self.crew) / 2):
-                raise ValueError(
-                    "Long missions need 50% experienced crew (5+ years)")
+        # Rule 3: Long missions need at least half the crew experienced
+        if self.duration_days > 365 and exp * 2 < len(self.crew):
+            raise ValueError(
+                "Long missions need 50% experienced crew (5+ years)")
 
         # Rule 4: All crew members must be active
-        if not all(m.is_active for m in self.crew):
+        if not all_active:
             raise ValueError("All crew members must be active")
 
         return self
 
+    @classmethod
+    def from_json_bytes(cls, raw: bytes) -> "SpaceMission":
+        return _MISSION_ADAPTER.validate_json(raw)
+
+
+_MISSION_ADAPTER = TypeAdapter(SpaceMission)
+_MISSIONS_ADAPTER = TypeAdapter(list[SpaceMission])
+
+
+def validate_missions(records: list[Mapping]) -> list[SpaceMission]:
+    return _MISSIONS_ADAPTER.validate_python(records)
+
+
+# Sample data for a valid mission setup.
+_VALID_MISSION_DATA = MappingProxyType({
+    "mission_id": "M2024_TITAN",
+    "mission_name": "Solar Observatory Research Mission",
+    "destination": "Solar Observatory",
+    "launch_date": "2024-03-30T00:00:00",
+    "duration_days": 451,
+    "crew": (
+        MappingProxyType({
+            "member_id": "CM001",
+            "name": "Sarah Williams",
+            "rank": "captain",
+            "age": 43,
+            "specialization": "Mission Command",
+            "years_experience": 19,
+            "is_active": True,
+        }),
+        MappingProxyType({
+            "member_id": "CM003",
+            "name": "Anna Jones",
+            "rank": "cadet",
+            "age": 35,
+            "specialization": "Communications",
+            "years_experience": 15,
+            "is_active": True,
+        }),
+    ),
+    "mission_status": "planned",
+    "budget_millions": 2208.1,
+})
+
+_INVALID_MISSION_DATA = MappingProxyType({
+    **_VALID_MISSION_DATA,
+    "crew": (
+        MappingProxyType({
+            "member_id": "CM999",
+            "name": "Noob Saibot",
+            "rank": "cadet",    # No leadership rank
+            "age": 20,
+            "specialization": "Cleaning",
+            "years_experience": 0,
+            "is_active": True,
+        }),
+    ),
+})
 
-def main() -> None:
-    # Sample data for a valid mission setup.
-    valid_data = {
-        "mission_id": "M2024_TITAN",
-        "mission_name": "Solar Observatory Research Mission",
-        "destination": "Solar Observatory",
-        "launch_date": "2024-03-30T00:00:00",
-        "duration_days": 451,
-        "crew": [
-            {
-                "member_id": "CM001",
-                "name": "Sarah Williams",
-                "rank": "captain",
-                "age": 43,
-                "specialization": "Mission Command",
-                "years_experience": 19,
-                "is_active": True,
-            },
-            {
-                "member_id": "CM003",
-                "name": "Anna Jones",
-                "rank": "cadet",
-                "age": 35,
-                "specialization": "Communications",
-                "years_experience": 15,
-                "is_active": True,
-            },
-        ],
-        "mission_status": "planned",
-        "budget_millions": 2208.1,
-    }
 
+def main() -> None:
     print("Space Mission Crew Validation")
-    print("==========================================")
+    print(_SEP)
     print("")
 
     try:
         # Create valid mission from dictionary
-        mission = SpaceMission.model_validate(valid_data)
+        mission = _MISSION_ADAPTER.validate_python(_VALID_MISSION_DATA)
         print("Valid mission created:")
         print(f"Mission: {mission.mission_name}")
         print(f"ID: {mission.mission_id}")
@@ -129,27 +178,28 @@ def main() -> None:
         print(f"Validation error: {e}")
 
     print("")
-    print("=========================================")
+    print(_SEP)
     print("Expected validation error:")
 
     try:
-        # Let's create an invalid mission (Invalid ID: doesn't start with M)
-        invalid_data = valid_data.copy()
-        invalid_data["crew"] = [
-            {
-                "member_id": "CM999",
-                "name": "Noob Saibot",
-                "rank": "cadet",    # No leadership rank
-                "age": 20,
-                "specialization": "Cleaning",
-                "years_experience": 0,
-                "is_active": True,
-            }
-        ]
-        SpaceMission.model_validate(invalid_data)
+        # Invalid mission: no Captain or Commander among the crew
+        _MISSION_ADAPTER.validate_python(_INVALID_MISSION_DATA)
     except ValidationError as e:
         # This gets the specific error me ssage from your validator
-        print(e.errors()[0]['msg'])
+        errors = e.errors(
+            include_url=False, include_context=False, include_input=False)
+        print(errors[0]['msg'])
+
+    print("")
+    print(_SEP)
+    # CASE 3: Batch with one valid and one invalid record
+    print("Expected batch validation error:")
+    try:
+        validate_missions([_VALID_MISSION_DATA, _INVALID_MISSION_DATA])
+    except ValidationError as e:
+        errors = e.errors(
+            include_url=False, include_context=False, include_input=False)
+        print(f"{errors[0]['loc']}: {errors[0]['msg']}")
 
 
 if __name__ == "__main__":